@@ -1,16 +1,34 @@
 from fastmcp import FastMCP
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 import os
 import json
+import asyncio
+import functools
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from datetime import datetime
 from utils import (
     write_large_result_to_file,
     _remove_links,
+    _loads,
+    _dumps,
+    TTLCache,
     get_default_output_dir,
     create_empty_response,
     format_error,
     validate_efo_id,
+    validate_efo_ids,
+    get_response_cache_dir,
+    read_cached_response,
+    prune_response_cache,
+    write_cached_response,
 )
 
 # instantiate server
@@ -19,36 +37,199 @@ mcp = FastMCP("GWAS_catalog")
 # Base URL for GWAS Catalog REST API
 BASE_URL = "https://www.ebi.ac.uk/gwas/rest/api"
 
+# Base URL for GWAS Summary Statistics API
+SUMMARY_STATS_BASE_URL = "https://www.ebi.ac.uk/gwas/summary-statistics/api"
+
+# Request URLs; per-ID URLs are bound str.format methods of prebuilt templates
+_ASSOCIATIONS_URL = BASE_URL + "/associations"
+_STUDY_ASSOCIATIONS_URL = (BASE_URL + "/studies/{}/associations").format
+_TRAIT_STUDIES_URL = (BASE_URL + "/efoTraits/{}/studies").format
+_TRAIT_ASSOCIATIONS_URL = (BASE_URL + "/efoTraits/{}/associations").format
+_VARIANT_ASSOCIATIONS_URL = (BASE_URL + "/singleNucleotidePolymorphisms/{}/associations").format
+_REGION_ASSOCIATIONS_URL = (SUMMARY_STATS_BASE_URL + "/chromosomes/{}/associations").format
+
 # Success status code
 SUCCESS_STATUS_CODE = 200
 
+# Status code of a request the API rejected as malformed (e.g., an unknown query parameter)
+BAD_REQUEST_STATUS_CODE = 400
+
+# Status code the API returns when nothing matches the request
+NOT_FOUND_STATUS_CODE = 404
+
 # Pagination for GWAS Catalog REST API: maximum number of items per request (recommended upper limit)
 GWAS_API_PAGE_SIZE = 1000
 
+# Maximum number of result pages fetched per request when following pagination links
+GWAS_API_MAX_PAGES = 20
+
 # Genome-wide significance threshold
 GWAS_THRESHOLD = 5e-8
 
+# Sort order pushed down to the API when ranking associations by p-value (pvalue = mantissa x 10^exponent)
+PVALUE_SORT_PARAMS = {"sort": ["pvalueExponent,asc", "pvalueMantissa,asc"]}
+
+# Maximum serialized size (bytes) of results returned in memory; larger results are written to file
+MAX_BYTES_IN_MEMORY = int(os.environ.get("GWAS_MAX_BYTES_IN_MEMORY", 16_000_000))
+
+# Maximum number of pooled connections per host kept alive by the shared session
+HTTP_POOL_MAXSIZE = 32
+
+# Maximum number of concurrent requests per batch tool call, kept low to be polite to the
+# EBI servers (must not exceed HTTP_POOL_MAXSIZE)
+MAX_CONCURRENT_REQUESTS = 8
+
+# Cache for raw API responses keyed by request URL: a small in-memory LRU in front of an
+# on-disk cache (see utils.get_response_cache_dir); GWAS_RESPONSE_CACHE_TTL=0 disables both
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Total size of the response bodies kept in memory
+RESPONSE_CACHE_TTL = float(os.environ.get("GWAS_RESPONSE_CACHE_TTL", 86400))
+_RESPONSE_CACHE = TTLCache(
+    maxsize=RESPONSE_CACHE_SIZE,
+    ttl=RESPONSE_CACHE_TTL,
+    maxbytes=RESPONSE_CACHE_MAX_BYTES,
+    sizeof=lambda entry: len(entry[1])  # entry: (request URL, body)
+)
+# On-disk tier: at most GWAS_CACHE_MAX_BYTES bytes, pruned on the first write and then
+# every RESPONSE_CACHE_PRUNE_INTERVAL writes (expired entries first, then the oldest)
+RESPONSE_CACHE_DISK_MAX_BYTES = int(os.environ.get("GWAS_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+RESPONSE_CACHE_PRUNE_INTERVAL = 100
+_RESPONSE_CACHE_WRITES = itertools.count()
+
+# HTTP timeouts in seconds: (connect, read)
+REQUEST_TIMEOUT = (5, 30)
+
+# Shared HTTP session: keeps connections to the EBI API alive across tool calls
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Accept": "application/json",
+    "User-Agent": "gwas-catalog-mcp",
+    # Compressed responses; 'br' is only advertised when a brotli decoder is installed
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        pool_block=True,  # Wait for a pooled connection instead of opening throwaway sockets
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False  # Hand the last response back so callers can inspect the status code
+        )
+    )
+)
+
+# Helper: run blocking tools off the event loop
+def _run_in_thread(func):
+    """
+    Wrap a blocking tool function as a coroutine that runs in a worker thread,
+    so concurrent tool calls do not block the MCP server's event loop.
+    Args:
+        func: Blocking tool function.
+    Returns:
+        Coroutine function with the same signature and docstring as func.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
+# Helper: GET and decode JSON
+def _fetch(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[int, str, Any]:
+    """
+    Helper function to GET a URL and decode its JSON body.
+    The body is streamed and read straight from the raw (decompressed) stream
+    to avoid an extra buffered copy of the response content.
+    Successful response bodies that parse as JSON are cached by fully-qualified
+    request URL, in memory and on disk, for RESPONSE_CACHE_TTL seconds.
+    Args:
+        url (str): Request URL.
+        params (Optional[Dict[str, Any]]): Query parameters.
+    Returns:
+        Tuple[int, str, Any]: HTTP status code, final request URL, and the decoded
+            JSON body (or a formatted error if the request was not successful).
+    """
+    cache_key = requests.Request("GET", url, params=params).prepare().url
+    cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is None:
+        cached = read_cached_response(get_response_cache_dir(), cache_key, RESPONSE_CACHE_TTL)
+        if cached is not None:
+            _RESPONSE_CACHE.set(cache_key, cached)
+    if cached is not None:
+        request_url, body = cached
+        try:
+            return SUCCESS_STATUS_CODE, request_url, _loads(body)
+        except ValueError:
+            pass  # Unreadable cache entry (e.g., from an older version): fetch it again
+
+    with _SESSION.get(url, params=params, timeout=REQUEST_TIMEOUT, stream=True) as resp:
+        if resp.status_code != SUCCESS_STATUS_CODE:
+            return resp.status_code, resp.url, format_error(resp)
+        request_url = resp.url
+        body = resp.raw.read(decode_content=True)
+
+    # Parse before caching, so a non-JSON or truncated body (e.g., a proxy error page) is never cached
+    data = _loads(body)
+    _RESPONSE_CACHE.set(cache_key, (request_url, body))
+    if RESPONSE_CACHE_TTL > 0:
+        cache_dir = get_response_cache_dir()
+        write_cached_response(cache_dir, cache_key, request_url, body)
+        if next(_RESPONSE_CACHE_WRITES) % RESPONSE_CACHE_PRUNE_INTERVAL == 0:
+            prune_response_cache(cache_dir, RESPONSE_CACHE_TTL, RESPONSE_CACHE_DISK_MAX_BYTES)
+    return SUCCESS_STATUS_CODE, request_url, data
+
+# (url, parameter names) pairs whose pushed-down parameters the API rejected
+_UNSUPPORTED_PUSHDOWN = set()
+
+# Helper: GET with optional server-side parameters
+def _fetch_with_pushdown(url: str, params: Optional[Dict[str, Any]], pushdown: Dict[str, Any]) -> Tuple[int, str, Any, bool]:
+    """
+    Helper function to GET a URL with extra parameters that let the API filter or
+    sort server-side. If the API rejects the request with them (HTTP 400) but accepts
+    it without, the parameters are remembered as unsupported for that URL and skipped
+    afterwards. Other failures (e.g., 404 or 5xx) are returned as is.
+    Callers must still filter/sort client-side, as APIs may silently ignore parameters.
+    Args:
+        url (str): Request URL.
+        params (Optional[Dict[str, Any]]): Query parameters always sent.
+        pushdown (Dict[str, Any]): Optional query parameters to push down to the API.
+    Returns:
+        Tuple[int, str, Any, bool]: Same as _fetch, plus whether the returned response
+            was requested with the pushed-down parameters.
+    """
+    key = (url, tuple(sorted(pushdown)))
+    if pushdown and key not in _UNSUPPORTED_PUSHDOWN:
+        status, request_url, data = _fetch(url, params={**(params or {}), **pushdown})
+        if status != BAD_REQUEST_STATUS_CODE:
+            return status, request_url, data, True
+        status, request_url, data = _fetch(url, params=params)
+        if status == SUCCESS_STATUS_CODE:
+            _UNSUPPORTED_PUSHDOWN.add(key)
+        return status, request_url, data, False
+    return (*_fetch(url, params=params), False)
+
 # Helper: GET single object
 def _get_object(path: str, remove_links: bool = True) -> Dict[str, Any]:
     """
     Helper function to get a single object from the API at the specified path.
+    Responses are cached by _fetch (see RESPONSE_CACHE_TTL).
     Args:
         path (str): API path.
         remove_links (bool): If True (default), remove all '_links' fields from the output.
     Returns:
         Dict[str, Any]: Response data.
     """
-    url = f"{BASE_URL}/{path}"
-    resp = requests.get(url)
-    if resp.status_code == SUCCESS_STATUS_CODE:
-        data = resp.json()
+    status, request_url, data = _fetch(f"{BASE_URL}/{path}")
+    if status == SUCCESS_STATUS_CODE:
         if isinstance(data, dict):
-            data["status"] = resp.status_code
-            data["request_url"] = resp.url
+            data["status"] = status
+            data["request_url"] = request_url
         if remove_links:
-            data = _remove_links(data)
-        return data
-    return format_error(resp)
+            _remove_links(data)
+    return data
 
 def _extract_embedded_items(data: Dict[str, Any], key: str = "associations") -> List[Dict[str, Any]]:
     """
@@ -69,36 +250,232 @@ def _extract_embedded_items(data: Dict[str, Any], key: str = "associations") ->
     items = embedded.get(key, [])
     
     # Handle Summary Statistics API response format where items are in a dictionary
-    if isinstance(items, dict) and all(str(k).isdigit() for k in items.keys()):
-        return list(items.values())
+    # keyed by consecutive indices ("0", "1", ...): probing the first key is enough
+    if isinstance(items, dict):
+        first_key = next(iter(items), "0")
+        return list(items.values()) if str(first_key).isdigit() else []
     
     return items if isinstance(items, list) else []
 
-def _add_gwas_significance(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _next_page_href(data: Any) -> Optional[str]:
+    """
+    Get the URL of the next result page from the '_links' field of a paginated response.
+    Args:
+        data (Any): API response data
+    Returns:
+        Optional[str]: Next page URL, or None if this is the last page
+    """
+    if not isinstance(data, dict):
+        return None
+    links = data.get("_links")
+    next_link = links.get("next") if isinstance(links, dict) else None
+    href = next_link.get("href") if isinstance(next_link, dict) else None
+    # Drop URI template suffixes such as '{?projection}'
+    return href.split("{", 1)[0] if href else None
+
+def _with_page_number(href: str, number: int) -> str:
+    """
+    Return the page URL with its 'page' query parameter set to number.
+    Args:
+        href (str): URL of a result page (e.g., the 'next' link)
+        number (int): Zero-based page number
+    Returns:
+        str: URL of the requested page
+    """
+    parts = urlsplit(href)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "page"]
+    query.append(("page", str(number)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+@dataclass(slots=True)
+class PageInfo:
+    """
+    Pagination outcome of _extract_all_items.
+    is_complete is False when pages were skipped (GWAS_API_MAX_PAGES reached, or a page failed).
+    """
+    pages_fetched: int
+    total_pages: Optional[int] = None
+    total_elements: Optional[int] = None
+    is_complete: bool = True
+
+def _first_page_info(data: Dict[str, Any]) -> PageInfo:
+    """
+    Get the PageInfo of a first result page, with the page totals the API reports (if any).
+    The page counts as complete only if it is the last one.
+    Args:
+        data (Dict[str, Any]): API response data of the first page
+    Returns:
+        PageInfo: Pagination outcome when only this page is used
+    """
+    page = data.get("page") if isinstance(data, dict) else None
+    page = page if isinstance(page, dict) else {}
+    total_pages = page.get("totalPages")
+    total_elements = page.get("totalElements")
+    return PageInfo(
+        pages_fetched=1,
+        total_pages=total_pages if isinstance(total_pages, int) else None,
+        total_elements=total_elements if isinstance(total_elements, int) else None,
+        is_complete=not _next_page_href(data)
+    )
+
+def _is_sorted_by_pvalue(items: List[Dict[str, Any]]) -> bool:
+    """
+    Check that association items are in PVALUE_SORT_PARAMS order, i.e., ascending by
+    (pvalueExponent, pvalueMantissa). The API may silently ignore the sort parameter,
+    so a page is only trusted to hold the best hits after this check.
+    Args:
+        items (List[Dict[str, Any]]): Association items of one result page
+    Returns:
+        bool: True if every item has both fields and the items are in ascending order
+    """
+    keys = []
+    for item in items:
+        try:
+            keys.append((int(item["pvalueExponent"]), float(item["pvalueMantissa"])))
+        except (KeyError, ValueError, TypeError):
+            return False
+    return all(a <= b for a, b in zip(keys, keys[1:]))
+
+def _extract_all_items(
+    data: Dict[str, Any],
+    key: str = "associations",
+    max_workers: int = MAX_CONCURRENT_REQUESTS
+) -> Tuple[List[Dict[str, Any]], PageInfo]:
     """
-    Add is_gwas_significant flag to items based on their p-value.
+    Extract items from the first page of an API response and from all following pages
+    (up to GWAS_API_MAX_PAGES pages in total).
+    When the response reports the total number of pages (GWAS REST API), the remaining
+    pages are fetched with up to max_workers concurrent requests; otherwise 'next' links
+    are followed one by one. Pages that fail are skipped and reported in the PageInfo.
+    Args:
+        data (Dict[str, Any]): API response data of the first page
+        key (str): Key to extract from _embedded (default: "associations")
+        max_workers (int): Maximum concurrent page requests (1 from batch tool workers,
+            so a batch call stays within MAX_CONCURRENT_REQUESTS requests in flight)
+    Returns:
+        Tuple[List[Dict[str, Any]], PageInfo]: Items from all fetched pages, and pagination outcome
+    """
+    items = _extract_embedded_items(data, key)
+    info = _first_page_info(data)
+    next_href = _next_page_href(data)
+    if not next_href:
+        return items, info
+
+    page = data.get("page")
+    total_pages = info.total_pages
+    if total_pages is not None and isinstance(page.get("number"), int):
+        page_numbers = range(page["number"] + 1, min(total_pages, GWAS_API_MAX_PAGES))
+        info.is_complete = total_pages <= GWAS_API_MAX_PAGES
+        if not page_numbers:
+            return items, info
+        fetch_page = lambda number: _fetch(_with_page_number(next_href, number))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(page_numbers))) as ex:
+                pages = list(ex.map(fetch_page, page_numbers))
+        else:
+            pages = map(fetch_page, page_numbers)
+        for status, _, page_data in pages:
+            if status != SUCCESS_STATUS_CODE:
+                info.is_complete = False
+                continue
+            items.extend(_extract_embedded_items(page_data, key))
+            info.pages_fetched += 1
+        return items, info
+
+    for _ in range(GWAS_API_MAX_PAGES - 1):
+        status, _, page_data = _fetch(next_href)
+        if status != SUCCESS_STATUS_CODE:
+            break
+        items.extend(_extract_embedded_items(page_data, key))
+        info.pages_fetched += 1
+        next_href = _next_page_href(page_data)
+        if not next_href:
+            break
+    # A 'next' link left over means pages were not fetched
+    info.is_complete = not next_href
+    return items, info
+
+def _add_gwas_significance(items: List[Dict[str, Any]], return_only_sig: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Add is_gwas_significant flag to items based on their p-value, counting and
+    optionally filtering significant items in the same pass.
     
     Args:
         items (List[Dict[str, Any]]): List of items containing p-values
+        return_only_sig (bool): If True, only keep genome-wide significant items
     Returns:
-        List[Dict[str, Any]]: Items with is_gwas_significant flag added
+        Tuple[List[Dict[str, Any]], int]: Items with is_gwas_significant flag added
+            (filtered if return_only_sig), and the number of significant items
     """
     if not items:
-        return items
-        
+        return items, 0
+
+    # Items from one endpoint share a schema: detect the p-value field once
+    # (REST API uses 'pvalue', Summary Statistics API uses 'p_value')
+    first = items[0]
+    key = 'pvalue' if 'pvalue' in first else ('p_value' if 'p_value' in first else None)
+
+    threshold = GWAS_THRESHOLD
+    kept = []
+    sig_count = 0
     for item in items:
+        p_str = item.get(key) if key is not None else None
         try:
-            # Try both pvalue and p_value fields
-            p_str = item.get('pvalue') or item.get('p_value')
-            if p_str is not None:
-                p = float(p_str)
-                item['is_gwas_significant'] = p <= GWAS_THRESHOLD
-            else:
-                item['is_gwas_significant'] = None
+            sig = float(p_str) <= threshold if p_str is not None else None
         except (ValueError, TypeError):
-            item['is_gwas_significant'] = None
-    
-    return items
+            sig = None
+        item['is_gwas_significant'] = sig
+        if sig:
+            sig_count += 1
+        if sig or not return_only_sig:
+            kept.append(item)
+
+    return (kept if return_only_sig else items), sig_count
+
+@dataclass(slots=True)
+class ResponseMetadata:
+    """
+    Metadata of a processed API response.
+    Fields left as None are omitted from the output dict.
+    """
+    subset_size: int
+    max_items_in_memory: int
+    return_only_sig: Optional[bool] = None
+    total_items: Optional[int] = None
+    significant_items: Optional[int] = None
+    output_file: Optional[str] = None
+    pages_fetched: Optional[int] = None
+    total_pages: Optional[int] = None
+    total_elements: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dict for the MCP response.
+        """
+        return {name: value for name in self.__slots__ if (value := getattr(self, name)) is not None}
+
+@dataclass(slots=True)
+class ApiResponse:
+    """
+    Standard envelope of a processed API response.
+    """
+    request_url: str
+    items: List[Any]
+    total_items_aft_process: int
+    is_complete: bool
+    metadata: ResponseMetadata
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dict for the MCP response (items are not copied).
+        """
+        return {
+            "request_url": self.request_url,
+            "items": self.items,
+            "total_items_aft_process": self.total_items_aft_process,
+            "is_complete": self.is_complete,
+            "metadata": self.metadata.to_dict()
+        }
 
 def _process_api_response(
     items: List[Dict[str, Any]],
@@ -109,10 +486,14 @@ def _process_api_response(
     output_dir: str = None,
     force_to_file: bool = False,
     force_no_file: bool = False,
-    skip_gwas_significance: bool = False
+    skip_gwas_significance: bool = False,
+    pages: Optional[PageInfo] = None
 ) -> Dict[str, Any]:
     """
     Process API response items with standard filtering and metadata.
+    Results with more than max_items_in_memory items, or larger than
+    MAX_BYTES_IN_MEMORY bytes once serialized, are written to file.
+    Results missing API pages (see PageInfo) are reported with is_complete False.
     
     Args:
         items (List[Dict[str, Any]]): List of items from API response
@@ -124,11 +505,21 @@ def _process_api_response(
         force_to_file (bool): Force file output
         force_no_file (bool): Never write to file
         skip_gwas_significance (bool): Skip GWAS significance processing
+        pages (Optional[PageInfo]): Pagination outcome from _extract_all_items
     Returns:
         Dict[str, Any]: Processed response with standard structure
     """
+    pages_complete = pages is None or pages.is_complete
+    pages_metadata = {} if pages is None else {
+        "pages_fetched": pages.pages_fetched,
+        "total_pages": pages.total_pages,
+        "total_elements": pages.total_elements
+    }
+
     if not items:
         empty_resp = create_empty_response(request_url, max_items_in_memory, return_only_sig)
+        empty_resp["is_complete"] = pages_complete
+        empty_resp["metadata"].update({k: v for k, v in pages_metadata.items() if v is not None})
         if not skip_gwas_significance:
             empty_resp["metadata"]["total_items"] = 0
             empty_resp["metadata"]["significant_items"] = 0
@@ -137,62 +528,70 @@ def _process_api_response(
     total_items = len(items)
     
     # Base metadata that's always included
-    metadata = {
-        "subset_size": 0,  # Will be updated later
-        "max_items_in_memory": max_items_in_memory
-    }
+    metadata = ResponseMetadata(
+        subset_size=0,  # Will be updated later
+        max_items_in_memory=max_items_in_memory,
+        **pages_metadata
+    )
     
     # Add GWAS significance flag and filter if needed
     if not skip_gwas_significance:
-        _add_gwas_significance(items)
-        sig_count = sum(1 for item in items if item.get("is_gwas_significant", False))
-        metadata.update({
-            "return_only_sig": return_only_sig,
-            "total_items": total_items,
-            "significant_items": sig_count
-        })
+        items, sig_count = _add_gwas_significance(items, return_only_sig)
+        metadata.return_only_sig = return_only_sig
+        metadata.total_items = total_items
+        metadata.significant_items = sig_count
         if return_only_sig:
-            items = [item for item in items if item.get("is_gwas_significant", False)]
             if not items:
                 empty_resp = create_empty_response(request_url, max_items_in_memory, return_only_sig)
-                empty_resp["metadata"].update(metadata)
+                empty_resp["is_complete"] = pages_complete
+                empty_resp["metadata"].update(metadata.to_dict())
                 return empty_resp
     
     # Remove _links if requested
     if remove_links:
-        items = _remove_links(items)
+        _remove_links(items)
     
-    # Handle large results
+    # Handle large results: spill to file when there are too many items, or when the
+    # items fit the count limit but their serialized size exceeds MAX_BYTES_IN_MEMORY
     total_items_aft_process = len(items)
-    if (total_items_aft_process > max_items_in_memory and not force_no_file) or force_to_file:
-        output_file = write_large_result_to_file(
+    subset_limit = max_items_in_memory
+    is_large = total_items_aft_process > max_items_in_memory
+    if not is_large and not force_no_file and not force_to_file:
+        payload_size = len(_dumps(items))
+        if payload_size > MAX_BYTES_IN_MEMORY:
+            is_large = True
+            # Keep about as many items as fit in the byte budget
+            subset_limit = max(1, MAX_BYTES_IN_MEMORY * total_items_aft_process // payload_size)
+    if (is_large and not force_no_file) or force_to_file:
+        subset = items[:subset_limit]
+        metadata.subset_size = len(subset)
+        metadata.output_file = write_large_result_to_file(
             output_dir or get_default_output_dir(),
             request_url,
             items
         )
-        metadata["subset_size"] = len(items[:max_items_in_memory])
-        metadata["output_file"] = output_file
-        return {
-            "request_url": request_url,
-            "items": items[:max_items_in_memory],
-            "total_items_aft_process": total_items_aft_process,
-            "is_complete": False,
-            "metadata": metadata
-        }
+        return ApiResponse(
+            request_url=request_url,
+            items=subset,
+            total_items_aft_process=total_items_aft_process,
+            is_complete=False,
+            metadata=metadata
+        ).to_dict()
     
-    metadata["subset_size"] = total_items_aft_process
-    return {
-        "request_url": request_url,
-        "items": items,
-        "total_items_aft_process": total_items_aft_process,
-        "is_complete": True,
-        "metadata": metadata
-    }
+    metadata.subset_size = total_items_aft_process
+    return ApiResponse(
+        request_url=request_url,
+        items=items,
+        total_items_aft_process=total_items_aft_process,
+        is_complete=pages_complete,
+        metadata=metadata
+    ).to_dict()
 
 @mcp.tool(
     name="get_study",
     description="[GWAS Catalog API] Retrieve detailed study information by study ID. Input: studyId (str): GWAS Catalog study identifier (e.g., 'GCST000001'), remove_links (bool, optional): If True (default), remove all '_links' fields from the output. Output: Dict[str, Any] containing study metadata and HTTP status code."
 )
+@_run_in_thread
 def get_study(studyId: str, remove_links: bool = True) -> Dict[str, Any]:
     """
     Retrieve detailed study information by study ID.
@@ -209,6 +608,7 @@ def get_study(studyId: str, remove_links: bool = True) -> Dict[str, Any]:
     name="get_association",
     description="[GWAS Catalog API] Retrieve detailed association information by association ID. Input: associationId (str): GWAS Catalog association identifier, remove_links (bool, optional): If True (default), remove all '_links' fields from the output. Output: Dict[str, Any] containing association fields and HTTP status code."
 )
+@_run_in_thread
 def get_association(associationId: str, remove_links: bool = True) -> Dict[str, Any]:
     """
     Retrieve detailed association information by association ID.
@@ -228,6 +628,7 @@ def get_association(associationId: str, remove_links: bool = True) -> Dict[str,
     name="get_variant",
     description="[GWAS Catalog API] Retrieve detailed variant information by variant ID. Input: variantId (str): Single nucleotide polymorphism identifier (e.g., 'rs123'), remove_links (bool, optional): If True (default), remove all '_links' fields from the output. Output: Dict[str, Any] containing variant annotations and HTTP status code."
 )
+@_run_in_thread
 def get_variant(variantId: str, remove_links: bool = True) -> Dict[str, Any]:
     """
     Retrieve detailed variant information by variant ID.
@@ -244,6 +645,7 @@ def get_variant(variantId: str, remove_links: bool = True) -> Dict[str, Any]:
     name="get_trait",
     description="[GWAS Catalog API] Retrieve trait information by EFO trait ID. Input: efoId (str): EFO trait identifier (e.g., 'EFO_0000305'), remove_links (bool, optional): If True (default), remove all '_links' fields from the output. Output: Dict[str, Any] containing trait details and HTTP status code."
 )
+@_run_in_thread
 def get_trait(efoId: str, remove_links: bool = True) -> Dict[str, Any]:
     """
     Retrieve trait information by EFO trait ID.
@@ -264,6 +666,7 @@ def get_trait(efoId: str, remove_links: bool = True) -> Dict[str, Any]:
     name="search_variants_in_region",
     description="[GWAS Catalog API] Search for associations by genomic region (GRCh38/hg38) and optional EFO trait filter. By default, returns only genome-wide significant associations (p<5e-8). Input: chromosome (str): Chromosome (e.g., '1'), start (int): GRCh38 base-pair start position, end (int): GRCh38 base-pair end position, efo_id (str, optional): EFO trait ID (e.g., 'EFO_0000305'), return_only_sig (bool, optional): If True (default), return only genome-wide significant associations, max_items_in_memory (int, optional): Threshold for in-memory results (default: 5000), force_to_file (bool, optional): Force file output regardless of size, output_dir (str, optional): Directory for file output (default: /tmp), force_no_file (bool, optional): Never write to file, remove_links (bool, optional): Remove '_links' fields (default: True). Output: Dict containing: 'request_url': API request URL, 'items': List of associations (limited to max_items_in_memory), 'total_count': Total number of results, 'is_complete': Boolean indicating if all results are included, 'metadata': Dict with 'subset_size', 'max_items_in_memory', and 'return_only_sig'. IMPORTANT: Always check 'metadata' and 'is_complete' to ensure you have all the data you need. If 'is_complete' is False, the complete dataset has been saved to 'output_file'."
 )
+@_run_in_thread
 def search_variants_in_region(
     chromosome: str,
     start: int,
@@ -297,26 +700,28 @@ def search_variants_in_region(
         validate_efo_id(efo_id)
         params["efoTrait"] = efo_id
     
-    resp = requests.get(f"{BASE_URL}/associations", params=params)
-    if resp.status_code != SUCCESS_STATUS_CODE:
-        return create_empty_response(resp.url, max_items_in_memory, return_only_sig)
+    status, request_url, data = _fetch(_ASSOCIATIONS_URL, params=params)
+    if status != SUCCESS_STATUS_CODE:
+        return create_empty_response(request_url, max_items_in_memory, return_only_sig)
     
-    items = _extract_embedded_items(resp.json())
+    items, pages = _extract_all_items(data)
     return _process_api_response(
         items=items,
-        request_url=resp.url,
+        request_url=request_url,
         max_items_in_memory=max_items_in_memory,
         return_only_sig=return_only_sig,
         remove_links=remove_links,
         output_dir=output_dir,
         force_to_file=force_to_file,
-        force_no_file=force_no_file
+        force_no_file=force_no_file,
+        pages=pages
     )
 
 @mcp.tool(
     name="get_variants_from_efo_ids",
     description="[GWAS Catalog API] Batch search for variants associated with each EFO trait ID in the provided list. By default, returns only genome-wide significant associations (p<5e-8). Input: efo_ids (List[str]): List of EFO trait identifiers (e.g., ['EFO_0001360', 'EFO_0004340']), return_only_sig (bool, optional): If True (default), return only genome-wide significant associations, max_items_in_memory (int, optional): Threshold for in-memory results (default: 5000), force_to_file (bool, optional): Force file output regardless of size, output_dir (str, optional): Directory for file output (default: /tmp), force_no_file (bool, optional): Never write to file, remove_links (bool, optional): Remove '_links' fields (default: True). Output: Dict containing: 'request_url': API request URL, 'items': Dict mapping EFO IDs to their respective results, where each result is a Dict containing {'request_url': API request URL specific to the EFO ID, 'items': List of associations for that EFO ID (limited to max_items_in_memory), 'total_count': Number of associations for that EFO ID, 'is_complete': Boolean indicating if all results are included, 'metadata': Dict with EFO ID-specific 'subset_size', 'max_items_in_memory', and 'return_only_sig'}, 'total_count': Total number of results across all EFO IDs, 'is_complete': Boolean indicating if all results are included, 'metadata': Dict with 'subset_size' (sum of all EFO IDs), 'max_items_in_memory', and 'return_only_sig'. IMPORTANT: Always check 'metadata' and 'is_complete' for both the overall result and each EFO ID's result to ensure you have all the data you need. If 'is_complete' is False for any EFO ID, that EFO ID's complete dataset has been saved to its own 'output_file'."
 )
+@_run_in_thread
 def get_variants_from_efo_ids(
     efo_ids: List[str],
     return_only_sig: bool = True,
@@ -343,34 +748,52 @@ def get_variants_from_efo_ids(
     Raises:
         ValueError: If any EFO ID does not match the EFO format (EFO_XXXXXXX).
     """
-    # Validate EFO ID format
-    for efo_id in efo_ids:
-        validate_efo_id(efo_id)
+    # Validate all EFO IDs before any request is made
+    validate_efo_ids(efo_ids)
 
-    results = {}
-    for efo_id in efo_ids:
-        resp = requests.get(f"{BASE_URL}/associations", params={"efoTrait": efo_id, "size": GWAS_API_PAGE_SIZE})
-        if resp.status_code != SUCCESS_STATUS_CODE:
-            results[efo_id] = create_empty_response(resp.url, max_items_in_memory, return_only_sig)
-            continue
-        
-        items = _extract_embedded_items(resp.json())
-        results[efo_id] = _process_api_response(
+    if not efo_ids:
+        return {}
+
+    # Build all request arguments up front
+    url = _ASSOCIATIONS_URL
+    base_params = {"size": GWAS_API_PAGE_SIZE}
+    requests_args = [(efo_id, {**base_params, "efoTrait": efo_id}) for efo_id in dict.fromkeys(efo_ids)]
+
+    def _fetch_and_process(params: Dict[str, Any]) -> Dict[str, Any]:
+        status, request_url, data = _fetch(url, params=params)
+        if status != SUCCESS_STATUS_CODE:
+            return create_empty_response(request_url, max_items_in_memory, return_only_sig)
+
+        # Pages are fetched one by one: this already runs in one of the batch workers
+        items, pages = _extract_all_items(data, max_workers=1)
+        return _process_api_response(
             items=items,
-            request_url=resp.url,
+            request_url=request_url,
             max_items_in_memory=max_items_in_memory,
             return_only_sig=return_only_sig,
             remove_links=remove_links,
             output_dir=output_dir,
             force_to_file=force_to_file,
-            force_no_file=force_no_file
+            force_no_file=force_no_file,
+            pages=pages
         )
-    return results
+
+    # Fetch and process all EFO IDs concurrently, so writing one EFO ID's large
+    # result to file overlaps with the requests for the others
+    processed = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(requests_args))) as ex:
+        futures = {ex.submit(_fetch_and_process, params): efo_id for efo_id, params in requests_args}
+        for future in as_completed(futures):
+            processed[futures[future]] = future.result()
+
+    # Keep the output order consistent with the input order
+    return {efo_id: processed[efo_id] for efo_id in efo_ids}
 
 @mcp.tool(
     name="trait_variant_ranking",
     description="[GWAS Catalog API] Rank variants by p-value (ascending order) for a specific EFO trait. By default, returns only genome-wide significant associations (p<5e-8). Input: efo_id (str): EFO trait ID, top_n (int, optional): Number of top records to return (default: 10), return_only_sig (bool, optional): If True (default), return only genome-wide significant associations, max_items_in_memory (int, optional): Threshold for in-memory results (default: 5000), force_to_file (bool, optional): Force file output regardless of size, output_dir (str, optional): Directory for file output (default: /tmp), force_no_file (bool, optional): Never write to file, remove_links (bool, optional): Remove '_links' fields (default: True). Output: Dict containing: 'request_url': API request URL, 'items': List of top N associations sorted by p-value in ascending order (lowest p-value first, limited to max_items_in_memory), where each association includes at minimum 'variant_id', 'pvalue', and trait-specific statistics, 'total_count': Total number of results before top N filtering, 'is_complete': Boolean indicating if all results were available for ranking (True if total results <= max_items_in_memory), 'metadata': Dict with 'subset_size', 'max_items_in_memory', and 'return_only_sig'. IMPORTANT: Always check 'metadata' and 'is_complete' to ensure the ranking was performed on the complete dataset. If 'is_complete' is False, the complete dataset has been saved to 'output_file', but the returned ranking may not represent the true top N across all data."
 )
+@_run_in_thread
 def trait_variant_ranking(
     efo_id: str,
     top_n: int = 10,
@@ -395,32 +818,55 @@ def trait_variant_ranking(
         ValueError: If efo_id is not a valid EFO ID format.
     """
     validate_efo_id(efo_id)
-    resp = requests.get(f"{BASE_URL}/associations", params={"efoTrait": efo_id, "size": GWAS_API_PAGE_SIZE})
-    if resp.status_code != SUCCESS_STATUS_CODE:
-        return create_empty_response(resp.url, max_items_in_memory, return_only_sig)
+    # Ask the API to sort by p-value: then the first page already holds the best hits
+    status, request_url, data, sorted_by_api = _fetch_with_pushdown(
+        _ASSOCIATIONS_URL,
+        params={"efoTrait": efo_id, "size": GWAS_API_PAGE_SIZE},
+        pushdown=PVALUE_SORT_PARAMS
+    )
+    if status != SUCCESS_STATUS_CODE:
+        return create_empty_response(request_url, max_items_in_memory, return_only_sig)
     
-    items = _extract_embedded_items(resp.json())
+    items = _extract_embedded_items(data)
+    pages = _first_page_info(data)
+    # If the API sorted the results (checked on the page, as the parameter may be silently
+    # ignored), the top N are on the first page and later pages are skipped; the result then
+    # keeps is_complete False, since the ranking did not see every page
+    api_sorted = sorted_by_api and len(items) >= top_n and _is_sorted_by_pvalue(items)
+    if not pages.is_complete and not api_sorted:
+        items, pages = _extract_all_items(data)
     if not items:
-        return create_empty_response(resp.url, max_items_in_memory, return_only_sig)
+        return create_empty_response(request_url, max_items_in_memory, return_only_sig)
     
-    # Sort by p-value before processing
-    sorted_items = sorted([v for v in items if v.get("pvalue")], key=lambda x: float(x.get("pvalue", float("inf"))))[:top_n]
+    # Select the top N by p-value, parsing each p-value only once
+    pairs = []
+    for item in items:
+        p = item.get("pvalue")
+        if p is None:
+            continue
+        try:
+            pairs.append((float(p), item))
+        except (ValueError, TypeError):
+            continue
+    sorted_items = [item for _, item in heapq.nsmallest(top_n, pairs, key=lambda pair: pair[0])]
     
     return _process_api_response(
         items=sorted_items,
-        request_url=resp.url,
+        request_url=request_url,
         max_items_in_memory=max_items_in_memory,
         return_only_sig=return_only_sig,
         remove_links=remove_links,
         output_dir=output_dir,
         force_to_file=force_to_file,
-        force_no_file=force_no_file
+        force_no_file=force_no_file,
+        pages=pages
     )
 
 @mcp.tool(
     name="get_study_associations",
     description="[GWAS Catalog API] Retrieve all associations for a given study ID. By default, returns only genome-wide significant associations (p<5e-8). Input: studyId (str): GWAS Catalog study identifier, return_only_sig (bool, optional): If True (default), return only genome-wide significant associations, max_items_in_memory (int, optional): Threshold for in-memory results (default: 5000), force_to_file (bool, optional): Force file output regardless of size, output_dir (str, optional): Directory for file output (default: /tmp), force_no_file (bool, optional): Never write to file, remove_links (bool, optional): Remove '_links' fields (default: True). Output: Dict containing: 'request_url': API request URL, 'items': List of association summaries (limited to max_items_in_memory), 'total_count': Total number of associations, 'is_complete': Boolean indicating if all results are included, 'metadata': Dict with 'subset_size', 'max_items_in_memory', and 'return_only_sig'. IMPORTANT: Always check 'metadata' and 'is_complete' to ensure you have all the data you need. If 'is_complete' is False, the complete dataset has been saved to 'output_file'."
 )
+@_run_in_thread
 def get_study_associations(
     studyId: str,
     return_only_sig: bool = True,
@@ -440,26 +886,28 @@ def get_study_associations(
     Output:
         List[Dict[str, Any]]: List of association summaries.
     """
-    resp = requests.get(f"{BASE_URL}/studies/{studyId}/associations")
-    if resp.status_code != SUCCESS_STATUS_CODE:
-        return create_empty_response(resp.url, max_items_in_memory, return_only_sig)
+    status, request_url, data = _fetch(_STUDY_ASSOCIATIONS_URL(studyId))
+    if status != SUCCESS_STATUS_CODE:
+        return create_empty_response(request_url, max_items_in_memory, return_only_sig)
     
-    items = _extract_embedded_items(resp.json())
+    items, pages = _extract_all_items(data)
     return _process_api_response(
         items=items,
-        request_url=resp.url,
+        request_url=request_url,
         max_items_in_memory=max_items_in_memory,
         return_only_sig=return_only_sig,
         remove_links=remove_links,
         output_dir=output_dir,
         force_to_file=force_to_file,
-        force_no_file=force_no_file
+        force_no_file=force_no_file,
+        pages=pages
     )
 
 @mcp.tool(
     name="get_trait_studies",
     description="[GWAS Catalog API] Retrieve studies associated with a specific EFO trait ID. Input: efoId (str): EFO trait identifier, max_items_in_memory (int, optional): Threshold for in-memory results (default: 5000), force_to_file (bool, optional): Force file output regardless of size, output_dir (str, optional): Directory for file output (default: /tmp), force_no_file (bool, optional): Never write to file, remove_links (bool, optional): Remove '_links' fields (default: True). Output: Dict containing: 'request_url': API request URL, 'items': List of study summaries (limited to max_items_in_memory), 'total_count': Total number of studies, 'is_complete': Boolean indicating if all results are included, 'metadata': Dict with 'subset_size' and 'max_items_in_memory'. IMPORTANT: Always check 'metadata' and 'is_complete' to ensure you have all the data you need. If 'is_complete' is False, the complete dataset has been saved to 'output_file'."
 )
+@_run_in_thread
 def get_trait_studies(
     efoId: str,
     max_items_in_memory: int = 5000,
@@ -476,27 +924,29 @@ def get_trait_studies(
     Output:
         List[Dict[str, Any]]: List of study summaries linked to the trait.
     """
-    resp = requests.get(f"{BASE_URL}/efoTraits/{efoId}/studies")
-    if resp.status_code != SUCCESS_STATUS_CODE:
-        return create_empty_response(resp.url, max_items_in_memory, False)  # No return_only_sig for studies
+    status, request_url, data = _fetch(_TRAIT_STUDIES_URL(efoId))
+    if status != SUCCESS_STATUS_CODE:
+        return create_empty_response(request_url, max_items_in_memory, False)  # No return_only_sig for studies
     
-    items = _extract_embedded_items(resp.json(), key="studies")
+    items, pages = _extract_all_items(data, key="studies")
     return _process_api_response(
         items=items,
-        request_url=resp.url,
+        request_url=request_url,
         max_items_in_memory=max_items_in_memory,
         return_only_sig=False,  # No return_only_sig for studies
         remove_links=remove_links,
         output_dir=output_dir,
         force_to_file=force_to_file,
         force_no_file=force_no_file,
-        skip_gwas_significance=True  # Skip GWAS significance processing for studies
+        skip_gwas_significance=True,  # Skip GWAS significance processing for studies
+        pages=pages
     )
 
 @mcp.tool(
     name="get_trait_associations",
     description="[GWAS Catalog API] Retrieve association IDs for a specific EFO trait ID. By default, returns only genome-wide significant associations (p<5e-8). Input: efoId (str): EFO trait identifier, return_only_sig (bool, optional): If True (default), return only genome-wide significant associations, max_items_in_memory (int, optional): Threshold for in-memory results (default: 5000), force_to_file (bool, optional): Force file output regardless of size, output_dir (str, optional): Directory for file output (default: /tmp), force_no_file (bool, optional): Never write to file, remove_links (bool, optional): Remove '_links' fields (default: True). Output: If successful, Dict containing: 'request_url': API request URL, 'items': List of association ID strings extracted from the '_links.self.href' field of each association (limited to max_items_in_memory), 'total_count': Total number of associations, 'is_complete': Boolean indicating if all results are included, 'metadata': Dict with 'subset_size', 'max_items_in_memory', and 'return_only_sig'. If the response format is unexpected or links are missing, returns the raw association data in the same structure. IMPORTANT: Always check 'metadata' and 'is_complete' to ensure you have all the data you need. If 'is_complete' is False, the complete dataset has been saved to 'output_file'."
 )
+@_run_in_thread
 def get_trait_associations(
     efoId: str,
     return_only_sig: bool = True,
@@ -516,26 +966,28 @@ def get_trait_associations(
     Output:
         List[str]: List of association ID strings linked to the trait.
     """
-    resp = requests.get(f"{BASE_URL}/efoTraits/{efoId}/associations")
-    if resp.status_code != SUCCESS_STATUS_CODE:
-        return create_empty_response(resp.url, max_items_in_memory, return_only_sig)
+    status, request_url, data = _fetch(_TRAIT_ASSOCIATIONS_URL(efoId))
+    if status != SUCCESS_STATUS_CODE:
+        return create_empty_response(request_url, max_items_in_memory, return_only_sig)
     
-    items = _extract_embedded_items(resp.json())
+    items, pages = _extract_all_items(data)
     return _process_api_response(
         items=items,
-        request_url=resp.url,
+        request_url=request_url,
         max_items_in_memory=max_items_in_memory,
         return_only_sig=return_only_sig,
         remove_links=remove_links,
         output_dir=output_dir,
         force_to_file=force_to_file,
-        force_no_file=force_no_file
+        force_no_file=force_no_file,
+        pages=pages
     )
 
 @mcp.tool(
     name="get_region_trait_associations",
     description="[GWAS Catalog API] Retrieve associations within a genomic region for a specific EFO trait ID. By default, returns only genome-wide significant associations (p<5e-8). Input: chromosome (str): Chromosome (e.g., '1'), start (int): Base-pair lower bound, end (int): Base-pair upper bound, efo_id (str): EFO trait ID (e.g., 'EFO_0008531'), return_only_sig (bool, optional): If True (default), return only genome-wide significant associations, max_items_in_memory (int, optional): Threshold for in-memory results (default: 5000), force_to_file (bool, optional): Force file output regardless of size, output_dir (str, optional): Directory for file output (default: /tmp), force_no_file (bool, optional): Never write to file, remove_links (bool, optional): Remove '_links' fields (default: True). Output: Dict containing: 'request_url': API request URL, 'items': List of associations (limited to max_items_in_memory), 'total_count': Total number of associations, 'is_complete': Boolean indicating if all results are included, 'metadata': Dict with 'subset_size', 'max_items_in_memory', and 'return_only_sig'. IMPORTANT: Always check 'metadata' and 'is_complete' to ensure you have all the data you need. If 'is_complete' is False, the complete dataset has been saved to 'output_file'."
 )
+@_run_in_thread
 def get_region_trait_associations(
     chromosome: str,
     start: int,
@@ -568,29 +1020,36 @@ def get_region_trait_associations(
         ValueError: If efo_id is not a valid EFO ID format.
     """
     validate_efo_id(efo_id)
-    summary_stats_base_url = "https://www.ebi.ac.uk/gwas/summary-statistics/api"
-    url = f"{summary_stats_base_url}/chromosomes/{chromosome}/associations"
+    url = _REGION_ASSOCIATIONS_URL(chromosome)
     params = {"bp_lower": start, "bp_upper": end, "efoTrait": efo_id}
-    resp = requests.get(url, params=params)
-    if resp.status_code != 200:
-        return create_empty_response(resp.url, max_items_in_memory, return_only_sig)
-    
-    items = _extract_embedded_items(resp.json())
+    # Let the Summary Statistics API drop non-significant rows server-side;
+    # _process_api_response still filters in case the parameter is ignored
+    pushdown = {"p_upper": GWAS_THRESHOLD} if return_only_sig else {}
+    status, request_url, data, pushed_down = _fetch_with_pushdown(url, params=params, pushdown=pushdown)
+    if status == NOT_FOUND_STATUS_CODE and pushed_down:
+        # No association passes p_upper in this region: a valid empty result
+        items, pages = [], None
+    elif status != SUCCESS_STATUS_CODE:
+        return create_empty_response(request_url, max_items_in_memory, return_only_sig)
+    else:
+        items, pages = _extract_all_items(data)
     return _process_api_response(
         items=items,
-        request_url=resp.url,
+        request_url=request_url,
         max_items_in_memory=max_items_in_memory,
         return_only_sig=return_only_sig,
         remove_links=remove_links,
         output_dir=output_dir,
         force_to_file=force_to_file,
-        force_no_file=force_no_file
+        force_no_file=force_no_file,
+        pages=pages
     )
 
 @mcp.tool(
     name="get_associations_from_variant",
     description="[GWAS Catalog API] Retrieve all associations for a specific variant ID using the direct SNP associations endpoint. By default, returns only genome-wide significant associations (p<5e-8). Input: variantId (str): Variant identifier (e.g., 'rs10875231'), return_only_sig (bool, optional): If True (default), return only genome-wide significant associations, max_items_in_memory (int, optional): Threshold for in-memory results (default: 5000), force_to_file (bool, optional): Force file output regardless of size, output_dir (str, optional): Directory for file output (default: /tmp), force_no_file (bool, optional): Never write to file, remove_links (bool, optional): Remove '_links' fields (default: True). Output: Dict containing: 'request_url': API request URL, 'items': List of associations (limited to max_items_in_memory), 'total_count': Total number of associations, 'is_complete': Boolean indicating if all results are included, 'metadata': Dict with 'subset_size', 'max_items_in_memory', and 'return_only_sig'. IMPORTANT: Always check 'metadata' and 'is_complete' to ensure you have all the data you need. If 'is_complete' is False, the complete dataset has been saved to 'output_file'."
 )
+@_run_in_thread
 def get_associations_from_variant(
     variantId: str = None,
     return_only_sig: bool = True,
@@ -625,21 +1084,22 @@ def get_associations_from_variant(
             "args": {"variantId": variantId}
         }
 
-    url = f"{BASE_URL}/singleNucleotidePolymorphisms/{variantId}/associations"
-    resp = requests.get(url)
-    if resp.status_code != SUCCESS_STATUS_CODE:
-        return create_empty_response(resp.url, max_items_in_memory, return_only_sig)
+    url = _VARIANT_ASSOCIATIONS_URL(variantId)
+    status, request_url, data = _fetch(url)
+    if status != SUCCESS_STATUS_CODE:
+        return create_empty_response(request_url, max_items_in_memory, return_only_sig)
     
-    items = _extract_embedded_items(resp.json())
+    items, pages = _extract_all_items(data)
     return _process_api_response(
         items=items,
-        request_url=resp.url,
+        request_url=request_url,
         max_items_in_memory=max_items_in_memory,
         return_only_sig=return_only_sig,
         remove_links=remove_links,
         output_dir=output_dir,
         force_to_file=force_to_file,
-        force_no_file=force_no_file
+        force_no_file=force_no_file,
+        pages=pages
     )
 
 if __name__ == "__main__":
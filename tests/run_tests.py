@@ -1,14 +1,22 @@
 #!/usr/bin/env python3
 from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import inspect
 import json
 import os
 import sys
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Ensure project root is in path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
 from tests.input.input_data import success_cases, error_cases, TestCase
 import server
 
@@ -16,6 +24,7 @@ import server
 OUTPUT_DIR = Path(__file__).parent / "output"
 SUCCESS_DIR = OUTPUT_DIR / "success"
 ERROR_DIR = OUTPUT_DIR / "error"
+MAX_WORKERS = 8
 
 def setup_test_directories() -> None:
     """
@@ -47,8 +56,12 @@ def write_test_result(
     status = "SUCCESS" if is_success else "ERROR"
     filepath = dest_dir / f"{func_name}.json"
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
     
     print(f"[{status}] Wrote output for {func_name}: {filepath}")
     return str(filepath)
@@ -74,6 +87,9 @@ def execute_test_case(test_case: TestCase) -> Tuple[Dict[str, Any], bool]:
     
     try:
         result = func(**test_case.args)
+        # Tools are coroutine functions; run them to completion
+        if inspect.isawaitable(result):
+            result = asyncio.run(result)
         # Check if result indicates an error
         is_success = not (isinstance(result, dict) and "error" in result)
         return result, is_success
@@ -90,9 +106,11 @@ def main() -> None:
     """
     setup_test_directories()
     
-    for test_case in success_cases + error_cases:
-        result, is_success = execute_test_case(test_case)
-        write_test_result(test_case.name, result, is_success)
+    # Test cases are network-bound: run them concurrently, write results in order
+    test_cases = success_cases + error_cases
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        for test_case, (result, is_success) in zip(test_cases, ex.map(execute_test_case, test_cases)):
+            write_test_result(test_case.name, result, is_success)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
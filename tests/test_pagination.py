@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Offline tests for pagination in server._extract_all_items and trait_variant_ranking,
+with server._fetch stubbed out.
+Run with: python -m unittest tests.test_pagination
+"""
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from unittest import mock
+import asyncio
+import os
+import sys
+import unittest
+
+# Ensure project root is in path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import server
+
+PAGE_URL = "https://example.org/api/associations?efoTrait=EFO_0000001&size=1"
+
+def make_page(number: int, total_pages: int) -> Dict[str, Any]:
+    """
+    Build one page of a paginated GWAS REST API response, holding a single item.
+    """
+    page = {
+        "_embedded": {"associations": [{"page": number}]},
+        "page": {"size": 1, "totalElements": total_pages, "totalPages": total_pages, "number": number},
+        "_links": {}
+    }
+    if number + 1 < total_pages:
+        page["_links"]["next"] = {"href": f"{PAGE_URL}&page={number + 1}"}
+    return page
+
+def fake_fetch(total_pages: int, failing_page: Optional[int] = None):
+    """
+    Build a stand-in for server._fetch serving total_pages pages, one of which may fail.
+    """
+    def _fetch(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[int, str, Any]:
+        number = int(parse_qs(urlsplit(url).query)["page"][0])
+        if number == failing_page:
+            return 503, url, {"status": 503}
+        return server.SUCCESS_STATUS_CODE, url, make_page(number, total_pages)
+    return _fetch
+
+class ExtractAllItemsTest(unittest.TestCase):
+    def extract(self, total_pages: int, failing_page: Optional[int] = None, max_workers: int = server.MAX_CONCURRENT_REQUESTS):
+        with mock.patch.object(server, "_fetch", side_effect=fake_fetch(total_pages, failing_page)):
+            return server._extract_all_items(make_page(0, total_pages), max_workers=max_workers)
+
+    def test_all_pages_fetched(self):
+        items, pages = self.extract(6)
+        self.assertEqual([item["page"] for item in items], list(range(6)))
+        self.assertEqual(pages.pages_fetched, 6)
+        self.assertTrue(pages.is_complete)
+
+    def test_pages_beyond_limit_are_reported(self):
+        items, pages = self.extract(30)
+        self.assertEqual(len(items), server.GWAS_API_MAX_PAGES)
+        self.assertEqual(pages.pages_fetched, server.GWAS_API_MAX_PAGES)
+        self.assertEqual(pages.total_pages, 30)
+        self.assertEqual(pages.total_elements, 30)
+        self.assertFalse(pages.is_complete)
+
+        result = server._process_api_response(
+            items=items,
+            request_url=PAGE_URL,
+            max_items_in_memory=5000,
+            return_only_sig=False,
+            force_no_file=True,
+            skip_gwas_significance=True,
+            pages=pages
+        )
+        self.assertFalse(result["is_complete"])
+        self.assertEqual(result["metadata"]["pages_fetched"], server.GWAS_API_MAX_PAGES)
+        self.assertEqual(result["metadata"]["total_pages"], 30)
+
+    def test_failed_page_keeps_later_pages(self):
+        for max_workers in (server.MAX_CONCURRENT_REQUESTS, 1):
+            with self.subTest(max_workers=max_workers):
+                items, pages = self.extract(6, failing_page=2, max_workers=max_workers)
+                self.assertEqual([item["page"] for item in items], [0, 1, 3, 4, 5])
+                self.assertEqual(pages.pages_fetched, 5)
+                self.assertFalse(pages.is_complete)
+
+    def test_failed_page_when_following_next_links(self):
+        # Without page totals only 'next' links can be followed, so pages after a failure are lost
+        first = make_page(0, 6)
+        del first["page"]
+        with mock.patch.object(server, "_fetch", side_effect=fake_fetch(6, failing_page=2)):
+            items, pages = server._extract_all_items(first)
+        self.assertEqual([item["page"] for item in items], [0, 1])
+        self.assertEqual(pages.pages_fetched, 2)
+        self.assertFalse(pages.is_complete)
+
+def fake_ranking_fetch(pages: Dict[int, list]):
+    """
+    Build a stand-in for server._fetch serving association pages with the given p-value exponents.
+    """
+    def _fetch(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[int, str, Any]:
+        query = parse_qs(urlsplit(url).query)
+        number = int(query["page"][0]) if "page" in query else 0
+        data = {
+            "_embedded": {"associations": [
+                {"pvalue": f"1e{exponent}", "pvalueExponent": exponent, "pvalueMantissa": 1.0}
+                for exponent in pages[number]
+            ]},
+            "page": {"size": 2, "totalElements": 2 * len(pages), "totalPages": len(pages), "number": number},
+            "_links": {}
+        }
+        if number + 1 < len(pages):
+            data["_links"]["next"] = {"href": f"{PAGE_URL}&page={number + 1}"}
+        return server.SUCCESS_STATUS_CODE, url, data
+    return _fetch
+
+class TraitVariantRankingTest(unittest.TestCase):
+    def rank(self, pages: Dict[int, list]) -> Dict[str, Any]:
+        with mock.patch.object(server, "_fetch", side_effect=fake_ranking_fetch(pages)):
+            return asyncio.run(server.trait_variant_ranking("EFO_0000001", top_n=2, return_only_sig=False))
+
+    def test_unsorted_first_page_ranks_all_pages(self):
+        result = self.rank({0: [-9, -10], 1: [-300, -200]})
+        self.assertEqual([item["pvalue"] for item in result["items"]], ["1e-300", "1e-200"])
+        self.assertTrue(result["is_complete"])
+        self.assertEqual(result["metadata"]["pages_fetched"], 2)
+
+    def test_sorted_first_page_is_not_complete(self):
+        result = self.rank({0: [-300, -200], 1: [-10, -9]})
+        self.assertEqual([item["pvalue"] for item in result["items"]], ["1e-300", "1e-200"])
+        self.assertFalse(result["is_complete"])
+        self.assertEqual(result["metadata"]["pages_fetched"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
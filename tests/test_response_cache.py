@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the API response cache (utils disk cache helpers and server._fetch),
+with the HTTP session stubbed out.
+Run with: python -m unittest tests.test_response_cache
+"""
+from unittest import mock
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+# Ensure project root is in path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import server
+from utils import _response_cache_path, prune_response_cache, read_cached_response, write_cached_response
+
+URL = "https://example.org/api/studies/GCST000001"
+
+def fake_response(body: bytes, status_code: int = 200) -> mock.MagicMock:
+    """
+    Build a stand-in for a streamed requests.Response (usable as a context manager).
+    """
+    resp = mock.MagicMock()
+    resp.__enter__.return_value = resp
+    resp.status_code = status_code
+    resp.url = URL
+    resp.content = body
+    resp.text = body.decode("utf-8", "replace")
+    resp.raw.read.return_value = body
+    return resp
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp.name, "cache")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def entry_paths(self):
+        return [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)]
+
+    def test_round_trip_in_private_dir(self):
+        write_cached_response(self.cache_dir, "key", URL, b"{}")
+        self.assertEqual(os.stat(self.cache_dir).st_mode & 0o777, 0o700)
+        self.assertEqual(read_cached_response(self.cache_dir, "key", 60), (URL, b"{}"))
+
+    def test_shared_dir_is_not_used(self):
+        os.makedirs(self.cache_dir)
+        os.chmod(self.cache_dir, 0o777)
+        write_cached_response(self.cache_dir, "key", URL, b"{}")
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+        os.chmod(self.cache_dir, 0o700)
+        write_cached_response(self.cache_dir, "key", URL, b"{}")
+        os.chmod(self.cache_dir, 0o777)
+        self.assertIsNone(read_cached_response(self.cache_dir, "key", 60))
+
+    def test_expired_entry_is_deleted_on_read(self):
+        write_cached_response(self.cache_dir, "key", URL, b"{}")
+        (path,) = self.entry_paths()
+        os.utime(path, (0, 0))
+        self.assertIsNone(read_cached_response(self.cache_dir, "key", 60))
+        self.assertFalse(os.path.exists(path))
+
+    def test_prune_removes_expired_then_oldest_entries(self):
+        now = time.time()
+        for key, age in (("expired", 7200), ("oldest", 30), ("older", 20), ("newest", 10)):
+            write_cached_response(self.cache_dir, key, URL, b"x" * 100)
+            os.utime(_response_cache_path(self.cache_dir, key), (now - age, now - age))
+        entry_size = os.path.getsize(_response_cache_path(self.cache_dir, "newest"))
+
+        prune_response_cache(self.cache_dir, 3600, max_bytes=2 * entry_size)
+        self.assertIsNone(read_cached_response(self.cache_dir, "expired", 3600))
+        self.assertIsNone(read_cached_response(self.cache_dir, "oldest", 3600))
+        self.assertIsNotNone(read_cached_response(self.cache_dir, "older", 3600))
+        self.assertIsNotNone(read_cached_response(self.cache_dir, "newest", 3600))
+
+class FetchCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp.name, "cache")
+        patches = (
+            mock.patch.dict(os.environ, {"GWAS_CACHE_DIR": self.cache_dir}),
+            mock.patch.object(server, "_RESPONSE_CACHE", server.TTLCache(maxsize=8, ttl=60)),
+            mock.patch.object(server, "RESPONSE_CACHE_TTL", 60)
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def fetch(self, body: bytes):
+        with mock.patch.object(server._SESSION, "get", return_value=fake_response(body)) as get:
+            return server._fetch(URL), get
+
+    def test_json_body_is_cached(self):
+        (status, _, data), _ = self.fetch(b'{"id": 1}')
+        self.assertEqual((status, data), (200, {"id": 1}))
+        self.assertIsNotNone(read_cached_response(self.cache_dir, URL, 60))
+
+        (status, _, data), get = self.fetch(b"not requested")
+        self.assertEqual((status, data), (200, {"id": 1}))
+        get.assert_not_called()
+
+    def test_non_json_body_is_not_cached(self):
+        with self.assertRaises(ValueError):
+            self.fetch(b"<html>Bad gateway</html>")
+        self.assertIsNone(server._RESPONSE_CACHE.get(URL))
+        self.assertIsNone(read_cached_response(self.cache_dir, URL, 60))
+
+    def test_unreadable_cache_entry_is_fetched_again(self):
+        write_cached_response(self.cache_dir, URL, URL, b'{"truncated": ')
+        (status, _, data), get = self.fetch(b'{"id": 2}')
+        self.assertEqual((status, data), (200, {"id": 2}))
+        get.assert_called_once()
+
+    def test_disk_cache_is_pruned_from_the_write_path(self):
+        with mock.patch.object(server, "RESPONSE_CACHE_PRUNE_INTERVAL", 1), \
+                mock.patch.object(server, "RESPONSE_CACHE_DISK_MAX_BYTES", 0):
+            self.fetch(b'{"id": 1}')
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+if __name__ == "__main__":
+    unittest.main()
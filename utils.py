@@ -1,11 +1,111 @@
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+from collections import OrderedDict
+from functools import lru_cache
 import os
-import uuid
+import re
+import hashlib
+import mmap
+import stat
+import threading
+import itertools
 import json
 import time
 
-# For timestamp conversion: constant to convert seconds to milliseconds
-MILLISECONDS = 1000
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+# EFO ID format: "EFO_" followed by digits (bound fullmatch method of the compiled pattern)
+_match_efo_id = re.compile(r"EFO_[0-9]+").fullmatch
+_EFO_ID_FORMAT_HINT = "Must be in format 'EFO_XXXXXXX' where X is a digit."
+
+# Per-process counter for unique large result file names
+_FILE_COUNTER = itertools.count()
+
+def _loads(content: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is available.
+    
+    Args:
+        content (Union[bytes, str]): Raw JSON document (e.g., response body)
+    
+    Returns:
+        Any: Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON, using orjson when it is available.
+    
+    Args:
+        obj (Any): Object to serialize
+    
+    Returns:
+        bytes: Serialized JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+    
+    Args:
+        maxsize (int): Maximum number of entries kept in the cache
+        ttl (float): Entry lifetime in seconds (0 or less disables caching)
+        maxbytes (Optional[int]): Maximum total size of the cached values, as measured by sizeof
+        sizeof (Optional[Callable[[Any], int]]): Size of a value in bytes (required with maxbytes)
+    """
+    def __init__(self, maxsize: int, ttl: float, maxbytes: Optional[int] = None, sizeof: Optional[Callable[[Any], int]] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self._data = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for key, or None if it is missing or expired.
+        """
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, size, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self._nbytes -= size
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store value under key, evicting least recently used entries if full.
+        Values larger than maxbytes on their own are not cached.
+        """
+        if self.ttl <= 0:
+            return
+        size = self.sizeof(value) if self.maxbytes is not None else 0
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            self._data[key] = (time.monotonic() + self.ttl, size, value)
+            self._nbytes += size
+            while len(self._data) > self.maxsize or (self.maxbytes is not None and self._nbytes > self.maxbytes):
+                self._nbytes -= self._data.popitem(last=False)[1][1]
 
 def validate_efo_id(efo_id: str) -> None:
     """
@@ -19,13 +119,48 @@ def validate_efo_id(efo_id: str) -> None:
     """
     if not isinstance(efo_id, str):
         raise ValueError(f"EFO ID must be a string, got {type(efo_id)}")
-    if not efo_id.startswith("EFO_") or not efo_id[4:].isdigit():
-        raise ValueError(f"Invalid EFO ID format: {efo_id}. Must be in format 'EFO_XXXXXXX' where X is a digit.")
+    _check_efo_id_format(efo_id)
+
+def validate_efo_ids(efo_ids: List[str]) -> None:
+    """
+    Validate the format of all EFO IDs in a list at once.
+    
+    Args:
+        efo_ids (List[str]): EFO identifiers to validate
+    
+    Raises:
+        ValueError: If any EFO ID is invalid (all invalid IDs are listed)
+    """
+    invalid = []
+    for efo_id in efo_ids:
+        try:
+            validate_efo_id(efo_id)
+        except ValueError:
+            invalid.append(efo_id)
+    if invalid:
+        raise ValueError(f"Invalid EFO IDs: {invalid}. {_EFO_ID_FORMAT_HINT}")
+
+@lru_cache(maxsize=8192)
+def _check_efo_id_format(efo_id: str) -> None:
+    """
+    Check the format of an EFO ID string. Only valid IDs are cached, since
+    lru_cache does not memoize calls that raise.
+    
+    Args:
+        efo_id (str): EFO identifier to check
+    
+    Raises:
+        ValueError: If the EFO ID format is invalid
+    """
+    if not _match_efo_id(efo_id):
+        raise ValueError(f"Invalid EFO ID format: {efo_id}. {_EFO_ID_FORMAT_HINT}")
 
 
 def write_large_result_to_file(output_dir: str, resp_url: str, items: Union[List[Any], Dict[str, Any]]) -> str:
     """
-    Write large result items to a file.
+    Write large result items to a file as compact UTF-8 JSON.
+    List items are serialized and written one at a time (one item per line), so the
+    full document is never built in memory.
     
     Args:
         output_dir (str): Directory to write the output file
@@ -40,37 +175,84 @@ def write_large_result_to_file(output_dir: str, resp_url: str, items: Union[List
     """
     try:
         os.makedirs(output_dir, exist_ok=True)
-        fname = f"large_result_{uuid.uuid4().hex}.json"
-        fpath = os.path.join(output_dir, fname)
-        with open(fpath, "w", encoding="utf-8") as f:
-            json.dump({"request_url": resp_url, "items": items}, f, ensure_ascii=False, indent=2)
+        # PID + per-process counter + timestamp names the file without drawing random bytes.
+        # Exclusive creation never follows a planted symlink or overwrites an existing file
+        # (e.g., from another process with the same PID sharing output_dir): try the next name
+        while True:
+            fname = f"large_result_{os.getpid()}_{next(_FILE_COUNTER)}_{int(time.time())}.json"
+            fpath = os.path.join(output_dir, fname)
+            try:
+                f = open(fpath, "xb")
+                break
+            except FileExistsError:
+                continue
+        with f:
+            f.write(b'{"request_url":' + _dumps(resp_url) + b',"items":')
+            if isinstance(items, list):
+                f.write(b"[")
+                for i, item in enumerate(items):
+                    f.write(b"\n" if i == 0 else b",\n")
+                    f.write(_dumps(item))
+                f.write(b"\n]" if items else b"]")
+            else:
+                f.write(_dumps(items))
+            f.write(b"}\n")
         print(f"[INFO] Complete result written to {fpath}")
         return fpath
     except OSError as e:
         raise OSError(f"Failed to write results to file: {e}")
 
+def read_large_result_file(fpath: str) -> Dict[str, Any]:
+    """
+    Read a file written by write_large_result_to_file.
+    The file is memory-mapped and parsed directly from the mapping (with orjson,
+    when available), avoiding read() copies for large results.
+    
+    Args:
+        fpath (str): Path to the result file
+    
+    Returns:
+        Dict[str, Any]: {"request_url": ..., "items": ...}
+    
+    Raises:
+        OSError: If the file cannot be opened
+        ValueError: If the file is empty or not valid JSON
+    """
+    with open(fpath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"Result file is empty: {fpath}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                # The stdlib json module does not accept memoryview
+                return _loads(view if orjson is not None else view.tobytes())
 
 def _remove_links(obj: Any) -> Any:
     """
-    Recursively remove '_links' fields from dicts and lists.
+    Remove '_links' fields from nested dicts and lists in place.
+    Walks the structure iteratively with an explicit stack, so deep trees do not hit
+    the recursion limit and no copies of the containers are made.
     
     Args:
         obj (Any): Input object (dict, list, or any other type)
     
     Returns:
-        Any: New object with all '_links' fields removed
+        Any: The same object, with all '_links' fields removed
     
     Examples:
         >>> _remove_links({"_links": {"self": "..."}, "data": 123})
         {"data": 123}
         >>> _remove_links([{"_links": {...}}, {"data": 123}])
-        [{"data": 123}, {"data": 123}]
+        [{}, {"data": 123}]
     """
-    if isinstance(obj, dict):
-        return {k: _remove_links(v) for k, v in obj.items() if k != "_links"}
-    elif isinstance(obj, list):
-        return [_remove_links(x) for x in obj]
-    return obj 
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            node.pop("_links", None)
+            stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, (dict, list)))
+    return obj
 
 def get_default_output_dir() -> str:
     """
@@ -82,6 +264,150 @@ def get_default_output_dir() -> str:
     """
     return os.environ.get("TEST_OUTPUT_SUCCESS_DIR", "/tmp")
 
+def get_response_cache_dir() -> str:
+    """
+    Get the directory of the on-disk API response cache.
+    Uses the GWAS_CACHE_DIR environment variable, otherwise a per-user directory
+    ($XDG_CACHE_HOME/gwas-catalog-mcp, defaulting to ~/.cache/gwas-catalog-mcp).
+    
+    Returns:
+        str: Path to the response cache directory
+    """
+    cache_dir = os.environ.get("GWAS_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "gwas-catalog-mcp")
+
+def _is_private_dir(path: str) -> bool:
+    """
+    Check that a directory is owned by the current user and not writable by others,
+    so cache entries planted by another user are never read.
+    
+    Args:
+        path (str): Directory to check
+    
+    Returns:
+        bool: True if the directory exists and is private to the current user
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return False
+    return not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+def _response_cache_path(cache_dir: str, key: str) -> str:
+    """
+    Get the cache file path for a cache key (e.g., a fully-qualified request URL).
+    
+    Args:
+        cache_dir (str): Response cache directory
+        key (str): Cache key
+    
+    Returns:
+        str: Path of the cache file (named by the SHA-256 hex digest of the key)
+    """
+    return os.path.join(cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+def read_cached_response(cache_dir: str, key: str, ttl: float) -> Optional[Tuple[str, bytes]]:
+    """
+    Read a cached API response body from disk. Expired entries are deleted.
+    
+    Args:
+        cache_dir (str): Response cache directory
+        key (str): Cache key (fully-qualified request URL)
+        ttl (float): Maximum age of the cache entry in seconds (0 or less disables the cache)
+    
+    Returns:
+        Optional[Tuple[str, bytes]]: (final request URL, response body), or None if missing,
+            expired, or the directory is not private to the current user
+    """
+    if ttl <= 0 or not _is_private_dir(cache_dir):
+        return None
+    fpath = _response_cache_path(cache_dir, key)
+    try:
+        if time.time() - os.path.getmtime(fpath) > ttl:
+            os.remove(fpath)
+            return None
+        with open(fpath, "rb") as f:
+            request_url = f.readline().decode("utf-8").rstrip("\n")
+            return request_url, f.read()
+    except OSError:
+        return None
+
+def write_cached_response(cache_dir: str, key: str, request_url: str, body: bytes) -> None:
+    """
+    Write an API response body to the on-disk cache.
+    The directory is created private to the current user (mode 0700); nothing is written
+    if an existing directory is not. The cache is best effort: write failures are ignored.
+    
+    Args:
+        cache_dir (str): Response cache directory
+        key (str): Cache key (fully-qualified request URL)
+        request_url (str): Final request URL of the response
+        body (bytes): Raw response body
+    """
+    fpath = _response_cache_path(cache_dir, key)
+    tmp_path = f"{fpath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        if not _is_private_dir(cache_dir):
+            return
+        with open(tmp_path, "wb") as f:
+            f.write(request_url.encode("utf-8") + b"\n")
+            f.write(body)
+        # Atomic rename so concurrent readers never see a partial entry
+        os.replace(tmp_path, fpath)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def prune_response_cache(cache_dir: str, ttl: float, max_bytes: Optional[int] = None) -> None:
+    """
+    Delete expired entries (and stale temporary files) from the on-disk response cache,
+    then the least recently written entries until the cache fits in max_bytes.
+    Best effort: errors are ignored.
+    
+    Args:
+        cache_dir (str): Response cache directory
+        ttl (float): Maximum age of a cache entry in seconds
+        max_bytes (Optional[int]): Maximum total size of the cache entries (None for no limit)
+    """
+    if not _is_private_dir(cache_dir):
+        return
+    cutoff = time.time() - max(ttl, 0)
+    kept = []  # (mtime, size, path) of the entries that are not expired
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    if st.st_mtime < cutoff:
+                        os.remove(entry.path)
+                    else:
+                        kept.append((st.st_mtime, st.st_size, entry.path))
+                except OSError:
+                    pass
+    except OSError:
+        return
+    if max_bytes is None:
+        return
+    total = sum(size for _, size, _ in kept)
+    for _, size, path in sorted(kept):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
 def create_empty_response(request_url: str, max_items_in_memory: int, return_only_sig: bool) -> Dict[str, Any]:
     """
     Create an empty response with standard metadata.
@@ -115,10 +441,10 @@ def format_error(resp: Any) -> Dict[str, Any]:
         Dict[str, Any]: Formatted error response
     """
     try:
-        err = resp.json()
+        err = _loads(resp.content)
     except Exception:
         err = {"error": "Invalid JSON", "message": resp.text}
     err["status"] = resp.status_code
     err["request_url"] = resp.url
-    err["timestamp"] = int(time.time() * MILLISECONDS)  # Convert to milliseconds
+    err["timestamp"] = time.time_ns() // 1_000_000  # Milliseconds since the epoch
     return err 
\ No newline at end of file